@@ -1,67 +1,94 @@
 from manim import *
-import math, random
+import random
+from collections import deque
 import numpy as np
 
+N = 60                    # number of nodes
+RADIUS = 3                # circle radius
+REWIRE_FRACTION = 0.059   # fraction of total edges to rewire (0 = lattice, 1 = random)
+SEED = 42                 # fixed seed so every render produces the same graph
+
+# Offset of the hop counter from the bottom-right corner
+_CORNER_SHIFT = UP * 0.3 + LEFT * 0.3
+
+
+def _bfs(adj, start, goal):
+    """Shortest path from start to goal in an adjacency dict, or [] if unreachable."""
+    queue = deque([start])
+    parent = {start: None}  # doubles as the visited set
+    while queue:
+        node = queue.popleft()
+        if node == goal:
+            path = []
+            while node is not None:
+                path.append(node)
+                node = parent[node]
+            return path[::-1]
+        for nei in adj[node]:
+            if nei not in parent:
+                parent[nei] = node
+                queue.append(nei)
+    return []
+
+
 class CurvedSmallWorld(Scene):
     def construct(self):
 
+        random.seed(SEED)
         self.camera.background_color = "#000000"
 
-        N = 60               # number of nodes
-        radius = 3           # circle radius
-        rewire_fraction = 0.059   # fraction of total edges to rewire (0 = lattice, 1 = random)
-
-
-        nodes = [
-            Dot(radius=0.09, color=WHITE).move_to(radius * np.array([math.cos(2*PI*i/N), math.sin(2*PI*i/N), 0]))
-            for i in range(N)
-        ]
+        theta = 2*np.pi*np.arange(N)/N
+        coords = RADIUS * np.column_stack([np.cos(theta), np.sin(theta), np.zeros(N)])
+        nodes = [Dot(radius=0.09, color=WHITE).move_to(coords[i]) for i in range(N)]
 
         # Animate node appearance
-        self.play(
-            LaggedStart(*[FadeIn(node, scale=0.3) for node in reversed(nodes)], lag_ratio=0.06)
-        )
+        node_group = VGroup(*reversed(nodes))
+        # run_time=None keeps the natural lagged duration instead of squeezing it into 2s
+        self.play(LaggedStartMap(FadeIn, node_group, scale=0.3, lag_ratio=0.06, run_time=None))
         self.wait(5.5)
 
         def arc_connection(i, j, color=WHITE, curvature=0.5, stroke_width=2):
-            p1, p2 = nodes[i].get_center(), nodes[j].get_center()
-            center = np.array([0, 0, 0])
-            angle = curvature if np.cross(p1-center, p2-center)[2] > 0 else -curvature
-            return ArcBetweenPoints(p1, p2, angle=angle, color=color, stroke_width=stroke_width)
+            # Nodes sit on a circle in index order, so the winding direction
+            # (sign of the cross product) is positive iff j is less than half a
+            # turn counter-clockwise of i; comparing 2 * offset keeps odd N exact
+            angle = curvature if 2 * ((j - i) % N) < N else -curvature
+            return ArcBetweenPoints(coords[i], coords[j], angle=angle, color=color, stroke_width=stroke_width)
 
         # adjacency set and edge map
         adjacency = {i: set() for i in range(N)}
         edge_map = {}
-        edges_list = []
+        edge_group = VGroup()
 
         for i in range(N):
-            for hop in [1, 2]:  # 1-hop (adjacent), 2-hop (alternate)
-                target = (i + hop) % N
-                key = (min(i, target), max(i, target))
-                if key in edge_map:
-                    continue
-
-                # Distinguish curvatures for visual clarity
-                if hop == 1:
-                    curvature = 0
-                else:
-                    curvature = -2
-
-                edge = arc_connection(i, target, color=WHITE, curvature=curvature)
-                edges_list.append(edge)
-                edge_map[key] = edge
-                adjacency[i].add(target)
-                adjacency[target].add(i)
+            # 1-hop (adjacent) edge, drawn straight
+            j = (i + 1) % N
+            edge = arc_connection(i, j, color=WHITE, curvature=0)
+            edge_group.add(edge)
+            edge_map[(i, j) if i < j else (j, i)] = edge  # j < i only on wrap-around
+            adjacency[i].add(j)
+            adjacency[j].add(i)
+
+            # 2-hop (alternate) edge, curved for visual clarity
+            j = (i + 2) % N
+            edge = arc_connection(i, j, color=WHITE, curvature=-2)
+            edge_group.add(edge)
+            edge_map[(i, j) if i < j else (j, i)] = edge
+            adjacency[i].add(j)
+            adjacency[j].add(i)
 
         # Display lattice edges
-        edge_group = VGroup(*edges_list)
         self.play(Create(edge_group), run_time=1.2)
         self.wait(7.5)
 
+        # Snapshot the lattice topology before rewiring mutates adjacency
+        lattice_adj = {i: adjacency[i].copy() for i in range(N)}
+        # the path helpers copy each segment before styling it, so plain references suffice
+        lattice_edge_map = dict(edge_map)
+
 
 
         total_edges = len(edge_map)
-        num_rewires = int(total_edges * rewire_fraction)
+        num_rewires = int(total_edges * REWIRE_FRACTION)
         all_edges = list(edge_map.keys())
         random.shuffle(all_edges)
         edges_to_rewire = all_edges[:num_rewires]
@@ -70,26 +97,32 @@ class CurvedSmallWorld(Scene):
         new_edges = []
 
         for (a, b) in edges_to_rewire:
-            if (a, b) not in edge_map:
+            old_edge = edge_map.pop((a, b), None)
+            if old_edge is None:
                 continue
-
-            old_edge = edge_map.pop((a, b))
             removed_edges.append(FadeOut(old_edge))
 
             adjacency[a].discard(b)
             adjacency[b].discard(a)
 
-            possible_targets = [x for x in range(N) if x != a and x not in adjacency[a]]
-            if not possible_targets:
-                continue
-            new_target = random.choice(possible_targets)
+            # Rejection-sample a target; degree is tiny relative to N so this
+            # almost always succeeds on the first draw
+            for _ in range(20):
+                new_target = random.randrange(N)
+                if new_target != a and new_target not in adjacency[a]:
+                    break
+            else:
+                possible_targets = list(set(range(N)) - adjacency[a] - {a})
+                if not possible_targets:
+                    continue
+                new_target = random.choice(possible_targets)
             new_key = (min(a, new_target), max(a, new_target))
-            if new_key in edge_map:
-                continue
-
             new_edge = arc_connection(a, new_target, color=WHITE, curvature=-1.2)
-            new_edges.append(Create(new_edge))
+            # edge_map mirrors adjacency and new_target is not adjacent to a,
+            # so new_key is never already present
             edge_map[new_key] = new_edge
+
+            new_edges.append(Create(new_edge))
             adjacency[a].add(new_target)
             adjacency[new_target].add(a)
 
@@ -108,91 +141,46 @@ class CurvedSmallWorld(Scene):
         self.play(Create(src_highlight), Create(dst_highlight))
         self.wait(7.5)
 
-        # --- Helper to find shortest path in adjacency ---
-        def bfs_path(start, goal):
-            from collections import deque
-            queue = deque([[start]])
-            visited = set([start])
-            while queue:
-                path = queue.popleft()
-                node = path[-1]
-                if node == goal:
-                    return path
-                for nei in adjacency[node]:
-                    if nei not in visited:
-                        visited.add(nei)
-                        queue.append(path + [nei])
-            return []
-
-        # Get path before rewiring (you can store adjacency before rewiring)
-        # For simplicity, rebuild original lattice adjacency
-        lattice_adj = {i: set([(i+1)%N, (i-1)%N, (i+2)%N, (i-2)%N]) for i in range(N)}
-        def lattice_bfs_path(start, goal):
-            from collections import deque
-            queue = deque([[start]])
-            visited = set([start])
-            while queue:
-                path = queue.popleft()
-                node = path[-1]
-                if node == goal:
-                    return path
-                for nei in lattice_adj[node]:
-                    if nei not in visited:
-                        visited.add(nei)
-                        queue.append(path + [nei])
-            return []
-
-        old_path = lattice_bfs_path(src, dst)
-        new_path = bfs_path(src, dst)
-        
-        lattice_edge_map = {}
-        for k, v in edge_map.items():
-            # copy so later changes to the scene don't modify these
-            lattice_edge_map[k] = v.copy().set_stroke(width=2).set_color(GREY_B)
-
-        
-
-        # Function to draw path lines
-        def draw_path(path, color, use_current=True):
-            """
-                path: list of node indices
-                color: color to draw with
-                use_current: if True, use edge_map (post-rewiring, contains shortcuts).
-                            if False, use lattice_edge_map (original lattice arcs).
-            """
+        old_path = _bfs(lattice_adj, src, dst)
+        new_path = _bfs(adjacency, src, dst)
+
+        # Helpers to draw path lines
+        def styled_copy(edge, color):
+            # use the existing arc for visual consistency
+            seg = edge.copy()
+            seg.set_color(color)
+            seg.set_stroke(width=4)
+            # ensure it's drawn above node dots
+            seg.set_z_index(nodes[0].z_index + 1)
+            return seg
+
+        def draw_lattice_path(path, color):
+            """BFS path over lattice_adj; every hop is an original lattice arc."""
+            return VGroup(*[
+                styled_copy(lattice_edge_map[(a, b) if a < b else (b, a)], color)
+                for a, b in zip(path, path[1:])
+            ])
+
+        def draw_current_path(path, color):
+            """BFS path over the rewired adjacency, using edge_map (contains shortcuts)."""
             lines = []
-            source_map = edge_map if use_current else lattice_edge_map
-
-            for i in range(len(path) - 1):
-                a, b = path[i], path[i + 1]
-                key = (min(a, b), max(a, b))
-
-                if key in source_map:
-                # use the existing arc for visual consistency
-                    seg = source_map[key].copy()
-                    seg.set_color(color)
-                    seg.set_stroke(width=4)
-                    # ensure it's drawn above node dots
-                    seg.move_to(seg.get_center())  # no-op but safe
-                    lines.append(seg)
+            for a, b in zip(path, path[1:]):
+                key = (a, b) if a < b else (b, a)
+                if key in edge_map:
+                    lines.append(styled_copy(edge_map[key], color))
                 else:
-                    # fallback to computed arc (same logic as arc_connection)
-                    p1, p2 = nodes[a].get_center(), nodes[b].get_center()
-                    center = np.array([0, 0, 0])
-                    curvature = 0.8 if np.cross(p1 - center, p2 - center)[2] > 0 else -0.8
-                    arc = ArcBetweenPoints(p1, p2, angle=curvature, color=color, stroke_width=4)
-                    lines.append(arc)
-
+                    # fallback to computed arc
+                    lines.append(arc_connection(a, b, color=color, curvature=0.8, stroke_width=4))
             return VGroup(*lines)
-        
+
         def make_hop_text(count, color=WHITE):
             text = Text(f"Hops: {count}", font_size=28, color=color)
-            text.to_corner(DR).shift(UP * 0.3 + LEFT * 0.3)
+            text.to_corner(DR).shift(_CORNER_SHIFT)
             return text
 
 
-        old_path_lines = draw_path(old_path, color=DARK_BLUE)
-        new_path_lines = draw_path(new_path, color=DARK_BROWN)
+        old_path_lines = draw_lattice_path(old_path, color=DARK_BLUE)
+        new_path_lines = draw_current_path(new_path, color=DARK_BROWN)
 
         
 
@@ -203,8 +191,13 @@ class CurvedSmallWorld(Scene):
 
         # Transition to new (shorter) path
         new_hop_text = make_hop_text(len(new_path) - 1, color=DARK_BROWN)
-        self.play(FadeOut(old_path_lines), Transform(old_hop_text, new_hop_text))
-        self.play(Create(new_path_lines))
+        self.play(
+            AnimationGroup(
+                AnimationGroup(FadeOut(old_path_lines), Transform(old_hop_text, new_hop_text)),
+                Create(new_path_lines),
+                lag_ratio=1,
+            )
+        )
         self.wait(4)
 
         self.play(FadeOut(new_path_lines), FadeOut(src_highlight), FadeOut(dst_highlight))
@@ -212,7 +205,7 @@ class CurvedSmallWorld(Scene):
 
 
         # info_text = Text(
-        #     f"hehe | Rewire fraction = {rewire_fraction}",
+        #     f"hehe | Rewire fraction = {REWIRE_FRACTION}",
         #     font_size=28,
         #     color=WHITE
         # ).to_corner(DOWN)